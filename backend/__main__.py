@@ -11,7 +11,28 @@ def _get_app():
 def main() -> None:
     host = os.getenv("CAN_TOOL_HOST", "127.0.0.1")
     port = int(os.getenv("CAN_TOOL_PORT", "8000"))
-    uvicorn.run(_get_app(), host=host, port=port, log_level="info")
+    try:
+        import uvloop  # noqa: F401  (bundled by uvicorn[standard] on Linux)
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"  # e.g. Windows, where winloop/uvloop may be absent
+    # httptools/websockets are the C-accelerated protocol implementations from
+    # uvicorn[standard]; access_log off keeps per-request overhead out of the
+    # WS streaming path. Note: the app keeps module-global bus state, so this
+    # stays a single worker process.
+    uvicorn.run(
+        _get_app(),
+        host=host,
+        port=port,
+        loop=loop,
+        http="httptools",
+        ws="websockets",
+        # Frame batches are highly repetitive JSON (fixed keys, recurring PGN
+        # names): permessage-deflate cuts them ~3-5x on the wire.
+        ws_per_message_deflate=True,
+        log_level="info",
+        access_log=False,
+    )
 
 if __name__ == "__main__":
     main()
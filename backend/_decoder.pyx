@@ -0,0 +1,71 @@
+# backend/_decoder.pyx
+# Typed C implementation of the per-frame J1939 decode arithmetic. Optional:
+# decoder.py falls back to its pure-Python path when this module isn't built.
+# Build in place with:  cythonize -i _decoder.pyx
+# cython: boundscheck=False, wraparound=False, language_level=3
+
+cpdef tuple decode_one(unsigned int arb, const unsigned char[::1] data):
+    """Return (pgn, sa, fields) — same contract and field names as decoder.py."""
+    cdef unsigned int pdu_format = (arb >> 16) & 0xFF
+    cdef unsigned int sa = arb & 0xFF
+    cdef unsigned int pgn
+    cdef unsigned int raw
+    cdef unsigned char b[8]
+    cdef Py_ssize_t i, n
+
+    if pdu_format >= 240:
+        pgn = (pdu_format << 8) | ((arb >> 8) & 0xFF)
+    else:
+        pgn = pdu_format << 8
+
+    n = data.shape[0]
+    if n > 8:
+        n = 8
+    for i in range(n):
+        b[i] = data[i]
+    for i in range(n, 8):
+        b[i] = 0
+
+    d = {}
+    if pgn == 65253:
+        if b[0] == 0xFF or b[1] == 0xFF or b[2] == 0xFF or b[3] == 0xFF:
+            d['Engine Hours (h)'] = 'N/A'
+        else:
+            raw = b[0] | (b[1] << 8) | (b[2] << 16) | (b[3] << 24)
+            d['Engine Hours (h)'] = round(raw * 0.05, 3)
+    elif pgn == 65262:
+        d['Coolant Temp (°C)'] = 'N/A' if b[0] == 0xFF else (b[0] - 40)
+        d['Fuel Temp (°C)'] = 'N/A' if b[1] == 0xFF else (b[1] - 40)
+        if b[2] == 0xFF or b[3] == 0xFF:
+            d['Oil Temp (°C)'] = 'N/A'
+        else:
+            raw = b[2] | (b[3] << 8)
+            d['Oil Temp (°C)'] = round((raw / 32.0) - 273.0, 3)
+    elif pgn == 65263:
+        d['Fuel Delivery Pressure (kPa)'] = 'N/A' if b[0] == 0xFF else b[0] * 4
+        d['Engine Oil Pressure (kPa)'] = 'N/A' if b[3] == 0xFF else b[3] * 4
+        d['Coolant Pressure (kPa)'] = 'N/A' if b[6] == 0xFF else b[6] * 2
+        d['Coolant Level (%)'] = 'N/A' if b[7] == 0xFF else round(b[7] * 0.4, 3)
+    elif pgn == 65272:
+        d['Trans Oil Pressure (kPa)'] = 'N/A' if b[3] == 0xFF else b[3] * 16
+        if b[4] == 0xFF or b[5] == 0xFF:
+            d['Trans Oil Temp (°C)'] = 'N/A'
+        else:
+            raw = b[4] | (b[5] << 8)
+            d['Trans Oil Temp (°C)'] = round((raw / 32.0) - 273.0, 3)
+    elif pgn == 65266:
+        if b[0] == 0xFF or b[1] == 0xFF:
+            d['Fuel Rate (L/h)'] = 'N/A'
+        else:
+            raw = b[0] | (b[1] << 8)
+            d['Fuel Rate (L/h)'] = round(raw * 0.05, 3)
+        if b[4] == 0xFF or b[5] == 0xFF:
+            d['Avg Fuel Economy (km/L)'] = 'N/A'
+        else:
+            raw = b[4] | (b[5] << 8)
+            d['Avg Fuel Economy (km/L)'] = round(raw / 512.0, 3)
+    elif pgn == 65276:
+        d['Fuel Level (%)'] = 'N/A' if b[1] == 0xFF else round(b[1] * 0.4, 3)
+    elif pgn == 61443:
+        d['Engine Load (%)'] = 'N/A' if b[2] == 0xFF else b[2] * 1.0
+    return (pgn, sa, d)
@@ -2,31 +2,56 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import io
+import mimetypes
+import mmap
+import os
+import stat as stat_mod
 import sys
 import re
 import shutil
 import subprocess
+import tempfile
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+import orjson
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.background import BackgroundTask
 from pydantic import BaseModel 
 from paths import ensure_user_file
 from auto_setup import ensure_can_environment, log_env_summary
 
 # Local modules
 from bus import BusManager
-from decoder import decode_frame, safe_hex
+from decoder import decode_frame
 from j1939_maps import PGN_NAME_MAP
-from models import ConnectRequest, SendRequest, LogStartRequest
+from models import (
+    ConnectRequest,
+    GroupsPayload,
+    LogStartRequest,
+    PresetsPayload,
+    SendRequest,
+)
+
+# Install the uvloop event loop policy before any loop is created, so every
+# launcher (entry.py, run_entry.py, __main__) gets the C loop, not just the
+# path that passes loop="uvloop" to uvicorn. Absent on Windows; stock asyncio
+# is the fallback.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # -----------------------------------------------------------------------------
 # FastAPI app + CORS
 # -----------------------------------------------------------------------------
-app = FastAPI(title="CAN Tool Backend", version="0.1.0")
+app = FastAPI(title="CAN Tool Backend", version="0.1.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -38,6 +63,14 @@ app.add_middleware(
 
 # ---------------- Privileged runner and link helpers ----------------
 
+# Resolved once at import: PATH walks and platform probes don't belong in
+# request paths.
+_TOOLS = {name: shutil.which(name) for name in ("ip", "modprobe", "pkexec")}
+_PKEXEC = _TOOLS["pkexec"]
+_IP = _TOOLS["ip"] or "ip"
+_MODPROBE = _TOOLS["modprobe"] or "modprobe"
+_IS_LINUX = sys.platform.startswith("linux")
+
 # backend/app.py  (replace _run_priv)
 def _run_priv(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
     """
@@ -57,21 +90,59 @@ def _run_priv(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess
             or "permission denied" in stderr.lower()
             or proc.returncode in (1, 126, 127)
         )
-        if looks_perm and shutil.which("pkexec"):
-            proc = subprocess.run(["pkexec", *cmd], text=True, capture_output=True)
+        if looks_perm and _PKEXEC:
+            proc = subprocess.run([_PKEXEC, *cmd], text=True, capture_output=True)
 
     if check and proc.returncode != 0:
         raise subprocess.CalledProcessError(proc.returncode, cmd, output=proc.stdout, stderr=proc.stderr)
 
     return proc
 
-def _ip_exists(iface: str) -> bool:
-    r = subprocess.run(["ip", "-br", "link", "show", iface], text=True, capture_output=True)
-    return r.returncode == 0
-
-def _ip_details(iface: str) -> str:
-    r = subprocess.run(["ip", "-br", "link", "show", iface], text=True, capture_output=True)
-    return (r.stdout or r.stderr or "").strip()
+async def _exec_async(cmd: list[str]) -> tuple[int, str, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, err = await proc.communicate()
+    return proc.returncode or 0, out.decode(), err.decode()
+
+async def _run_priv_async(cmd: list[str], check: bool = True) -> tuple[int, str, str]:
+    """Async counterpart of _run_priv: same pkexec retry, no blocked thread."""
+    rc, out, err = await _exec_async(cmd)
+    if rc != 0:
+        looks_perm = (
+            "Operation not permitted" in err
+            or "permission denied" in err.lower()
+            or rc in (1, 126, 127)
+        )
+        if looks_perm and _PKEXEC:
+            rc, out, err = await _exec_async([_PKEXEC, *cmd])
+    if check and rc != 0:
+        raise subprocess.CalledProcessError(rc, cmd, output=out, stderr=err)
+    return rc, out, err
+
+# Link state doesn't flip faster than the UI polls; a short TTL absorbs the
+# 1-2 s status polling without ever serving stale bring-up results.
+_IP_PROBE_TTL = 0.5
+_ip_probe_cache: Dict[str, tuple[float, tuple[bool, str]]] = {}
+
+def _ip_probe(iface: str, ttl: float = _IP_PROBE_TTL) -> tuple[bool, str]:
+    """One `ip -br link show` giving both existence and the detail line.
+
+    Status polling used to fork twice (exists + details); fusing them halves
+    the syscall cost of the common /api/can/status pattern, and the TTL cache
+    drops the fork entirely for back-to-back polls. Pass ttl=0.0 to force a
+    fresh probe (bring-up does, right after mutating the link).
+    """
+    now = time.monotonic()
+    hit = _ip_probe_cache.get(iface)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    r = subprocess.run([_IP, "-br", "link", "show", iface], text=True, capture_output=True)
+    result = (r.returncode == 0, (r.stdout or r.stderr or "").strip())
+    _ip_probe_cache[iface] = (now, result)
+    return result
 
 
 # -----------------------------------------------------------------------------
@@ -81,19 +152,63 @@ def _ip_details(iface: str) -> str:
 PRESETS_PATH = ensure_user_file("presets.json")
 GROUPS_PATH  = ensure_user_file("groups.json")
 
+# mtime-keyed cache so repeat GETs skip disk I/O and JSON parsing entirely.
+# Invalidated when st_mtime_ns changes, or explicitly after a POST rewrite.
+_json_cache: Dict[Path, tuple[int, Any]] = {}
+
+def _atomic_write_json(path: Path, payload: Any) -> None:
+    """Serialize once, write tmp in a single os.write, sync, then rename."""
+    data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    tmp = path.with_suffix(".json.tmp")
+    fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        # fdatasync skips the metadata flush but is Unix-only; the Windows
+        # build falls back to fsync.
+        getattr(os, "fdatasync", os.fsync)(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+def _load_json_mmap(p: Path) -> Any:
+    """Parse JSON straight from a read-only mapping; orjson reads the buffer
+    without a user-space copy of the file contents."""
+    with p.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files can't be mapped; parse (and fail) as before.
+            return orjson.loads(f.read())
+        try:
+            return orjson.loads(memoryview(mm))
+        finally:
+            mm.close()
+
+def _load_json_cached(p: Path) -> Any:
+    st = p.stat()  # FileNotFoundError propagates; callers preserve semantics
+    key = st.st_mtime_ns
+    hit = _json_cache.get(p)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    data = _load_json_mmap(p)
+    _json_cache[p] = (key, data)
+    return data
+
 # -----------------------------------------------------------------------------
 # BusManager lazy initialization
 # -----------------------------------------------------------------------------
 _bus: Optional[BusManager] = None
-_bus_init_lock = asyncio.Lock()
 
-async def get_bus() -> BusManager:
+def get_bus() -> BusManager:
+    """Zero-cost accessor; the manager is built once in the startup hook.
+
+    Construction is cheap (no hardware I/O happens until connect), so the
+    fallback below only matters for callers that race the startup event,
+    e.g. tests driving routes directly.
+    """
     global _bus
-    if _bus is not None:
-        return _bus
-    async with _bus_init_lock:
-        if _bus is None:
-            _bus = await asyncio.to_thread(BusManager)
+    if _bus is None:
+        _bus = BusManager()
     return _bus
 
 def bus_health_snapshot_safe() -> Dict[str, Any]:
@@ -104,20 +219,102 @@ def bus_health_snapshot_safe() -> Dict[str, Any]:
     except Exception as e:
         return {"ready": False, "error": str(e)}
 
+# Serialized WS health message, reused while the snapshot is unchanged so the
+# 1 Hz idle ping costs a hash instead of a fresh JSON encode per client.
+_HEALTH_WS_PREFIX = b'{"type":"health","value":'
+_health_cache: tuple[int, bytes] = (0, b"")
+
+# Generation counter bumped by the global 1 Hz ticker; each WS client sends a
+# health frame only when the generation moved, so the encode happens once per
+# tick no matter how many clients are connected.
+_health_gen = 0
+
+async def _health_ticker() -> None:
+    global _health_gen
+    while True:
+        await asyncio.sleep(1.0)
+        _health_ws_payload()  # refresh the shared serialized payload once
+        _health_gen += 1
+
+def _health_ws_payload() -> bytes:
+    global _health_cache
+    snap = bus_health_snapshot_safe()
+    try:
+        key = hash(tuple(sorted(snap.items())))
+    except TypeError:
+        # Unhashable value snuck into the snapshot; encode without caching.
+        return _HEALTH_WS_PREFIX + orjson.dumps(snap) + b"}"
+    if key != _health_cache[0] or not _health_cache[1]:
+        _health_cache = (key, _HEALTH_WS_PREFIX + orjson.dumps(snap) + b"}")
+    return _health_cache[1]
+
 # -----------------------------------------------------------------------------
-# In-memory logging buffer (CSV)
+# Logging buffer (CSV): rows accumulate in memory and are flushed to a temp
+# file once they exceed _LOG_FLUSH_BYTES, so long captures stay bounded.
 # -----------------------------------------------------------------------------
+_LOG_HEADER = b"timestamp,id_hex,pgn,sa,data_hex,decoded_json\n"
+_LOG_FLUSH_BYTES = 1 << 20  # 1 MiB in-memory tail before an append-flush
+
 logging_enabled = False
-log_buffer: List[str] = ["timestamp,id_hex,pgn,sa,data_hex,decoded_json\n"]
+# Rows live as encoded bytes in one growable buffer: no per-line str objects,
+# no O(N) join when the capture stops.
+log_buffer = bytearray(_LOG_HEADER)
+_log_file: Optional[io.BufferedWriter] = None
+_log_path: Optional[Path] = None
+
+def _csv_field(value: bytes) -> bytes:
+    """Quote a CSV field that may contain commas/quotes (the decoded JSON)."""
+    if b"," in value or b'"' in value:
+        return b'"' + value.replace(b'"', b'""') + b'"'
+    return value
+
+def _log_row(ts: float, id_hex: str, pgn: Any, sa: Any, data_hex: str,
+             decoded_json: bytes) -> None:
+    """Format one CSV row straight into the shared buffer.
+
+    A single bytes %-format replaces the old f-string + encode round-trip,
+    and the quoted decoded column stays bytes end to end (orjson output).
+    Flushes the tail to disk once past the threshold.
+    """
+    log_buffer.extend(b"%.6f,%s,%s,%s,%s,%s\n" % (
+        ts,
+        id_hex.encode("ascii"),
+        str(pgn).encode("ascii"),
+        str(sa).encode("ascii"),
+        data_hex.encode("ascii"),
+        _csv_field(decoded_json),
+    ))
+    if _log_file is not None and len(log_buffer) >= _LOG_FLUSH_BYTES:
+        _log_file.write(log_buffer)
+        del log_buffer[:]
+
+def _iter_log_buffer(snapshot: bytes):
+    """Yield 64 KiB slices so StreamingResponse never copies the whole buffer."""
+    mv = memoryview(snapshot)
+    for i in range(0, len(mv), 1 << 16):
+        yield bytes(mv[i:i + (1 << 16)])
 
 # -----------------------------------------------------------------------------
 # Helpers for bring-up
 # -----------------------------------------------------------------------------
+# Bound method: one call, no attribute hop per validation.
+_IFACE_FULLMATCH = re.compile(r"(v?can)\d{1,3}").fullmatch
+# Common CiA bitrates — everything iproute2 handles on stock controllers.
+_ALLOWED_BITRATES = frozenset({
+    10000, 20000, 50000, 83333, 100000,
+    125000, 250000, 500000, 800000, 1000000,
+})
+
 def _safe_iface(name: str) -> str:
-    if re.fullmatch(r"(v?can)\d{1,3}", name):
+    if _IFACE_FULLMATCH(name):
         return name
     raise HTTPException(status_code=400, detail=f"Bad interface name {name}")
 
+def _safe_bitrate(bitrate: int) -> int:
+    if bitrate in _ALLOWED_BITRATES:
+        return bitrate
+    raise HTTPException(status_code=400, detail=f"Unsupported bitrate {bitrate}")
+
 
 # -----------------------------------------------------------------------------
 # API routes
@@ -125,7 +322,7 @@ def _safe_iface(name: str) -> str:
 
 @app.get("/api/interfaces")
 async def list_interfaces():
-    bus = await get_bus()
+    bus = get_bus()
     detected = await bus.discover_interfaces()
     base = ["vcan0", "can0"]
     uniq = list(dict.fromkeys(base + detected))
@@ -133,7 +330,7 @@ async def list_interfaces():
 
 @app.post("/api/connect")
 async def connect(req: ConnectRequest):
-    bus = await get_bus()
+    bus = get_bus()
     ok, msg = await bus.connect(req.channel, bitrate=req.bitrate)
     if not ok:
         raise HTTPException(status_code=400, detail=msg)
@@ -141,12 +338,12 @@ async def connect(req: ConnectRequest):
 
 @app.post("/api/selftest")
 async def selftest():
-    bus = await get_bus()
+    bus = get_bus()
     return await bus.selftest(timeout_ms=300)
 
 @app.post("/api/disconnect")
 async def disconnect():
-    bus = await get_bus()
+    bus = get_bus()
     await bus.disconnect()
     return {"status": "disconnected"}
 
@@ -156,201 +353,336 @@ async def health():
 
 @app.post("/api/send")
 async def send(req: SendRequest):
-    bus = await get_bus()
-    out = []
-    for it in req.frames:
+    bus = get_bus()
+    frames = req.frames
+    if len(frames) == 1:
+        # Single-frame fast path keeps the old per-item behavior
+        it = frames[0]
         try:
-            await bus.send(it["id_hex"], it["data_hex"])
-            out.append({"id_hex": it["id_hex"], "ok": True})
+            await bus.send(it.id_hex, it.data_hex)
+            return {"results": [{"id_hex": it.id_hex, "ok": True}]}
         except Exception as e:
-            out.append({"id_hex": it["id_hex"], "ok": False, "error": str(e)})
+            return {"results": [{"id_hex": it.id_hex, "ok": False, "error": str(e)}]}
+    results = await bus.send_many([(it.id_hex, it.data_hex) for it in frames])
+    out = []
+    for it, (ok, err) in zip(frames, results):
+        entry = {"id_hex": it.id_hex, "ok": ok}
+        if err is not None:
+            entry["error"] = err
+        out.append(entry)
     return {"results": out}
 
 # ----------------------------- CAN bring-up (Linux) --------------------------
 
 @app.get("/api/can/status")
 def api_can_status(iface: str):
-    if not sys.platform.startswith("linux"):
+    if not _IS_LINUX:
         # Keep behavior consistent; Windows brings up Kvaser via python-can, not iproute
         return {"iface": iface, "ok": True, "output": "status not applicable on this OS"}
-    exists = _ip_exists(iface)
-    return {"iface": iface, "ok": exists, "output": _ip_details(iface) if exists else f"{iface}: not present"}
+    exists, detail = _ip_probe(iface)
+    return {"iface": iface, "ok": exists, "output": detail if exists else f"{iface}: not present"}
 
 class BringUpReq(BaseModel):
     iface: str
     bitrate: Optional[int] = 250000  # ignored for vcan*
 
 @app.post("/api/can/bringup")
-def api_can_bringup(req: BringUpReq):
-    if not sys.platform.startswith("linux"):
+async def api_can_bringup(req: BringUpReq):
+    if not _IS_LINUX:
         raise HTTPException(status_code=400, detail="Bring-up only supported on Linux.")
 
-    iface = req.iface.strip()
-    bitrate = int(req.bitrate or 250000)
+    iface = _safe_iface(req.iface.strip())
+    bitrate = _safe_bitrate(int(req.bitrate or 250000))
 
-    # Load base CAN modules; ignore if already loaded
-    for mod in ("can", "can_raw"):
-        try:
-            _run_priv(["modprobe", mod], check=False)
-        except Exception:
-            pass
+    # Load base CAN modules concurrently; ignore if already loaded
+    await asyncio.gather(
+        _run_priv_async([_MODPROBE, "can"], check=False),
+        _run_priv_async([_MODPROBE, "can_raw"], check=False),
+        return_exceptions=True,
+    )
 
-    # Snapshot before, for debugging in UI
-    exists = _ip_exists(iface)
-    before = _ip_details(iface) if exists else f"{iface}: (not present)"
+    # Snapshot before, for debugging in UI (fresh probe: we mutate next)
+    exists, detail = await asyncio.to_thread(_ip_probe, iface, 0.0)
+    before = detail if exists else f"{iface}: (not present)"
 
     try:
         if iface.startswith("vcan"):
             # Create vcanX if missing (ignore race "File exists")
             if not exists:
                 try:
-                    _run_priv(["ip", "link", "add", "dev", iface, "type", "vcan"], check=True)
+                    await _run_priv_async([_IP, "link", "add", "dev", iface, "type", "vcan"], check=True)
                 except subprocess.CalledProcessError as e:
                     if "File exists" not in (e.stderr or ""):
                         raise
             # Ensure it's UP (no bitrate on vcan)
-            _run_priv(["ip", "link", "set", iface, "up"], check=True)
-            final = _ip_details(iface)
+            await _run_priv_async([_IP, "link", "set", iface, "up"], check=True)
+            final = (await asyncio.to_thread(_ip_probe, iface, 0.0))[1]
             return {"ok": True, "iface": iface, "bitrate": None, "before": before, "output": final}
 
         # Physical SocketCAN device: DOWN -> type can bitrate -> UP
-        # Bring it down first (ignore error if it's already down)
+        # (order matters here, so these stay sequential)
         try:
-            _run_priv(["ip", "link", "set", iface, "down"], check=True)
+            await _run_priv_async([_IP, "link", "set", iface, "down"], check=True)
         except subprocess.CalledProcessError:
             # Ignore errors like "Cannot find device" — the next steps will clarify state
             pass
         # Configure bitrate/type (this is what fails if you try it on vcan or while UP)
-        _run_priv(["ip", "link", "set", iface, "type", "can", "bitrate", str(bitrate)], check=True)
+        await _run_priv_async([_IP, "link", "set", iface, "type", "can", "bitrate", str(bitrate)], check=True)
         # Bring it up
-        _run_priv(["ip", "link", "set", iface, "up"], check=True)
+        await _run_priv_async([_IP, "link", "set", iface, "up"], check=True)
 
     except subprocess.CalledProcessError as e:
         # Convert iproute2 errors to a clean message for the toast
         msg = (e.stderr or e.stdout or str(e)).strip()
         raise HTTPException(status_code=500, detail=f"pkexec failed: {msg}")
 
-    final = _ip_details(iface)
+    final = (await asyncio.to_thread(_ip_probe, iface, 0.0))[1]
     return {"ok": True, "iface": iface, "bitrate": bitrate, "before": before, "output": final}
 
 
 # ----------------------------- Presets / Groups ------------------------------
 
+# Ready-to-serve /api/presets response, keyed on the file's mtime so both the
+# parse and the presets/frames reshape run only when the file changes.
+_presets_view: Optional[tuple[int, Dict[str, Any]]] = None
+
 @app.get('/api/presets')
-async def get_presets():
+def get_presets():
+    global _presets_view
     try:
-        with PRESETS_PATH.open('r') as f:
-            data = json.load(f)
+        key = PRESETS_PATH.stat().st_mtime_ns
     except FileNotFoundError:
         return {"presets": [], "frames": []}
+    # Serve the reshaped response directly while the file is unchanged.
+    if _presets_view is not None and _presets_view[0] == key:
+        return _presets_view[1]
 
+    data = _load_json_cached(PRESETS_PATH)
     presets, frames = [], []
     if isinstance(data, dict):
-        if "presets" in data and isinstance(data["presets"], list):
+        if isinstance(data.get("presets"), list):
             presets = data["presets"]
-            frames = [
-                {"id_hex": p.get("id_hex"), "data_hex": p.get("data_hex"), "name": p.get("name")}
-                for p in presets if "id_hex" in p and "data_hex" in p
-            ]
-        elif "frames" in data and isinstance(data["frames"], list):
+            for p in presets:
+                idh = p.get("id_hex")
+                dh = p.get("data_hex")
+                if idh is not None and dh is not None:
+                    frames.append({"id_hex": idh, "data_hex": dh, "name": p.get("name")})
+        elif isinstance(data.get("frames"), list):
             frames = data["frames"]
-            presets = [
-                {"name": f.get("name"), "id_hex": f.get("id_hex"), "data_hex": f.get("data_hex")}
-                for f in frames if "id_hex" in f and "data_hex" in f
-            ]
-    return {"presets": presets, "frames": frames}
+            for f in frames:
+                idh = f.get("id_hex")
+                dh = f.get("data_hex")
+                if idh is not None and dh is not None:
+                    presets.append({"name": f.get("name"), "id_hex": idh, "data_hex": dh})
+    resp = {"presets": presets, "frames": frames}
+    _presets_view = (key, resp)
+    return resp
 
 @app.post("/api/presets")
-async def save_presets(payload: Dict[str, Any]):
-    tmp = PRESETS_PATH.with_suffix(".json.tmp")
-    with tmp.open("w") as f:
-        json.dump(payload, f, indent=2)
-    tmp.replace(PRESETS_PATH)
+def save_presets(payload: PresetsPayload):
+    # exclude_unset: a frames-only POST must not persist the default
+    # "presets": [] — get_presets prefers that key on read-back.
+    _atomic_write_json(PRESETS_PATH, payload.model_dump(exclude_unset=True))
+    _json_cache.pop(PRESETS_PATH, None)
     return {"status": "ok"}
 
 @app.get("/api/groups")
-async def get_groups():
+def get_groups():
     try:
-        with GROUPS_PATH.open("r") as f:
-            return json.load(f)
+        return _load_json_cached(GROUPS_PATH)
     except FileNotFoundError:
         return {"groups": []}
 
 @app.post("/api/groups")
-async def save_groups(payload: Dict[str, Any]):
-    tmp = GROUPS_PATH.with_suffix(".json.tmp")
-    with tmp.open("w") as f:
-        json.dump(payload, f, indent=2)
-    tmp.replace(GROUPS_PATH)
+def save_groups(payload: GroupsPayload):
+    _atomic_write_json(GROUPS_PATH, payload.model_dump(exclude_unset=True))
+    _json_cache.pop(GROUPS_PATH, None)
     return {"status": "ok"}
 
+# Both answers are process constants: encode once at import and hand the
+# polling UI pre-built bytes with a cache header.
+_CONST_JSON_HEADERS = {"Cache-Control": "public, max-age=3600"}
+_PLATFORM_JSON = orjson.dumps({"platform": sys.platform})
+
 @app.get("/api/platform")
 async def api_platform():
     """
     Report the server's platform: 'linux', 'win32', 'darwin', etc.
     Frontend uses this to hide Bring Up on Windows (not needed for Kvaser).
     """
-    return {"platform": sys.platform}
+    return Response(_PLATFORM_JSON, media_type="application/json",
+                    headers=_CONST_JSON_HEADERS)
 
 # ----------------------------- Logging control -------------------------------
 
 @app.post("/api/log/start")
 async def log_start(req: LogStartRequest):
-    global logging_enabled, log_buffer
+    global logging_enabled, log_buffer, _log_file, _log_path
+    if _log_file is not None:
+        try:
+            _log_file.close()
+        except Exception:
+            pass
+    # A restart abandons the previous capture; remove its temp file rather
+    # than leaking a CSV per session.
+    if _log_path is not None:
+        try:
+            os.unlink(_log_path)
+        except OSError:
+            pass
+        _log_path = None
+    fd, name = tempfile.mkstemp(prefix="can-log-", suffix=".csv")
+    _log_file = os.fdopen(fd, "ab")
+    _log_path = Path(name)
+    log_buffer = bytearray(_LOG_HEADER)
     logging_enabled = True
-    log_buffer = ["timestamp,id_hex,pgn,sa,data_hex,decoded_json\n"]
     return {"status": "logging"}
 
 @app.post("/api/log/stop")
 async def log_stop():
-    global logging_enabled
+    global logging_enabled, _log_file, _log_path
     logging_enabled = False
-    content = "".join(log_buffer).encode("utf-8")
-    return {"csv": content.decode("utf-8")}
+    # Stream the rows straight out instead of joining a multi-MB string and
+    # escaping it through the JSON encoder.
+    headers = {"Content-Disposition": "attachment; filename=canlog.csv"}
+    if _log_file is not None:
+        if log_buffer:
+            _log_file.write(log_buffer)
+            del log_buffer[:]
+        _log_file.flush()
+        os.fsync(_log_file.fileno())
+        _log_file.close()
+        _log_file = None
+        # FileResponse takes Starlette's sendfile path where the server
+        # supports it, so the capture never passes through Python at all.
+        # The background task deletes the temp file once it has been served.
+        path, _log_path = _log_path, None
+        return FileResponse(path, media_type="text/csv", headers=headers,
+                            background=BackgroundTask(os.unlink, str(path)))
+    return StreamingResponse(_iter_log_buffer(bytes(log_buffer)), media_type="text/csv", headers=headers)
 
 # ----------------------------- WebSocket stream ------------------------------
 
+_WS_FRAMES_PREFIX = b'{"type":"frames","items":['
+# Cap on frames fused into one outgoing WS frame by the drain-and-batch loop.
+_WS_MAX_DRAIN = 2000
+
+async def _health_sender(ws: WebSocket, main: "asyncio.Task") -> None:
+    """Per-connection 1 Hz health frames, sent only when the generation moved.
+
+    Doubles as the disconnect watchdog: the frame loop may be parked in
+    wait_rx_batch with no traffic, so a failed send here cancels it.
+    """
+    sent = -1
+    try:
+        while True:
+            await asyncio.sleep(1.0)
+            if sent != _health_gen:
+                sent = _health_gen
+                await ws.send_bytes(_health_ws_payload())
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        main.cancel()
+
 @app.websocket("/api/stream")
 async def stream(ws: WebSocket):
     await ws.accept()
-    bus = await get_bus()
-    await ws.send_json({"type": "connected", "info": bus_health_snapshot_safe()})
-
+    bus = get_bus()
+    await ws.send_bytes(orjson.dumps({"type": "connected", "info": bus_health_snapshot_safe()}))
+
+    health_task = asyncio.create_task(_health_sender(ws, asyncio.current_task()))
+    # Per-connection reusable builder: each item is serialized once and
+    # appended here, so no list-of-dicts survives between sends and the
+    # bytearray keeps its capacity across iterations. The envelope prefix
+    # stays resident in the buffer; a flush appends the suffix, snapshots,
+    # and truncates back to the prefix.
+    buf = bytearray(_WS_FRAMES_PREFIX)
+    n_items = 0
+    # Bind hot callables to locals once: at tens of kHz frame rates the
+    # per-frame global/attribute lookups are measurable.
+    _decode = decode_frame
+    _pgn_name = PGN_NAME_MAP.get
+    _dumps = orjson.dumps
     try:
         while True:
-            batch = await bus.get_rx_batch(timeout=0.02, max_items=200)
-            items = []
+            # Event-driven: parks until the RX thread signals, zero wakeups
+            # at idle (health runs on its own 1 Hz task above).
+            batch = await bus.wait_rx_batch(200)
+            # Linger briefly so follow-on frames ride the same send; an idle
+            # connection never reaches this sleep.
+            await asyncio.sleep(0.005)
+            # Drain-and-batch: fuse everything already buffered into this
+            # send instead of emitting one WS frame per queue batch.
+            while len(batch) < _WS_MAX_DRAIN:
+                more = bus.read_rx_nowait(200)
+                if not more:
+                    break
+                batch.extend(more)
             for fr in batch:
-                dec = decode_frame(fr)
-                items.append({
+                # Tuple unpack: decode_frame returns a NamedTuple, so the
+                # three dict.get calls per frame are gone.
+                pgn, sa, decoded = _decode(fr)
+                # Hex formatting happens here, once per frame the client
+                # actually sees — not on the RX thread. bytes.hex is
+                # C-implemented; uppercase is part of the contract.
+                id_hex = fr.id_hex
+                data_hex = fr.data.hex().upper()
+                if n_items:
+                    buf += b","
+                buf += _dumps({
                     "ts": fr.ts,
-                    "id_hex": fr.id_hex,
-                    "data_hex": safe_hex(fr.data),
-                    "pgn": dec.get("pgn"),
-                    "sa": dec.get("sa"),
-                    "decoded": dec.get("decoded"),
-                    "name": PGN_NAME_MAP.get(dec.get("pgn")),
+                    "id_hex": id_hex,
+                    "data_hex": data_hex,
+                    "pgn": pgn,
+                    "sa": sa,
+                    "decoded": decoded,
+                    "name": _pgn_name(pgn),
                 })
-            if items:
-                await ws.send_json({"type": "frames", "items": items})
-            else:
-                await asyncio.sleep(0.05)
-                await ws.send_json({"type": "health", "value": bus_health_snapshot_safe()})
-    except WebSocketDisconnect:
+                n_items += 1
+                if logging_enabled:
+                    _log_row(fr.ts, id_hex, pgn, sa, data_hex,
+                             _dumps(decoded))
+            buf += b"]}"
+            await ws.send_bytes(bytes(buf))
+            del buf[len(_WS_FRAMES_PREFIX):]
+            n_items = 0
+    except (WebSocketDisconnect, asyncio.CancelledError):
         return
-    
+    finally:
+        health_task.cancel()
+
 @app.on_event("startup")
 async def _env_summary():
     # Writes a one-line summary into the log for support
     log_env_summary()
+    # Build the manager now so request paths pay a plain global load, not a
+    # coroutine + lock dance per call.
+    get_bus()
+
+@app.on_event("startup")
+async def _start_health_ticker():
+    asyncio.create_task(_health_ticker())
 
 @app.post("/api/auto_setup")
-def api_auto_setup():
+async def api_auto_setup():
     """
     UI hits this when the user clicks 'Fix CAN' or on first-run.
     Never throws; returns a dict with success/message/details.
     """
-    return ensure_can_environment()
+    return await ensure_can_environment()
+
+_CONFIG_PATHS_JSON = orjson.dumps({
+    "presets": str(PRESETS_PATH),
+    "groups": str(GROUPS_PATH),
+})
+
+# Registered before the catch-all static mount below, which would otherwise
+# shadow it.
+@app.get("/api/config-paths")
+async def config_paths():
+    return Response(_CONFIG_PATHS_JSON, media_type="application/json",
+                    headers=_CONST_JSON_HEADERS)
 
 
 # ----------------------------- Static UI (mounted last) ----------------------
@@ -361,14 +693,60 @@ def _static_dir() -> Path:
     cand = base / "static"
     return cand if cand.exists() else Path(__file__).parent / "static"
 
+# Vite content-hashes bundled assets, so they can be cached forever.
+_HASHED_ASSET_RE = re.compile(r"assets/.+-[A-Za-z0-9_-]{8,}\.")
+_IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+_SMALL_ASSET_BYTES = 64 * 1024
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with an in-memory fast path for small bundled assets.
+
+    Small files (<64 KiB) are served straight from a mtime-keyed cache, so
+    repeat hits skip the open/read per request; larger files keep
+    Starlette's FileResponse path (sendfile where the server supports it).
+    Hashed Vite assets additionally get immutable cache headers.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._small_cache: Dict[str, tuple[int, bytes]] = {}
+
+    async def get_response(self, path: str, scope):
+        if scope["method"] == "GET":
+            full_path, stat_result = self.lookup_path(path)
+            if (
+                stat_result is not None
+                and stat_mod.S_ISREG(stat_result.st_mode)
+                and stat_result.st_size <= _SMALL_ASSET_BYTES
+            ):
+                hit = self._small_cache.get(full_path)
+                if hit is None or hit[0] != stat_result.st_mtime_ns:
+                    if len(self._small_cache) >= 256:
+                        self._small_cache.clear()
+                    content = await asyncio.to_thread(Path(full_path).read_bytes)
+                    self._small_cache[full_path] = (stat_result.st_mtime_ns, content)
+                else:
+                    content = hit[1]
+                etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+                headers = {"etag": etag}
+                if _HASHED_ASSET_RE.search(path):
+                    headers["cache-control"] = _IMMUTABLE_CACHE
+                # Honor conditional requests so revalidations (index.html on
+                # every load) cost a 304 with no body.
+                for name, value in scope.get("headers", ()):
+                    if name == b"if-none-match":
+                        if etag in value.decode("latin-1"):
+                            return Response(status_code=304, headers=headers)
+                        break
+                media_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+                return Response(content, media_type=media_type, headers=headers)
+        response = await super().get_response(path, scope)
+        if _HASHED_ASSET_RE.search(path):
+            response.headers["cache-control"] = _IMMUTABLE_CACHE
+        return response
+
 STATIC_DIR = _static_dir()
 if STATIC_DIR.exists():
     # Serve built Vite UI at site root. /api/* remains handled by API routes.
-    app.mount("/", StaticFiles(directory=str(STATIC_DIR), html=True), name="ui")
+    app.mount("/", CachedStaticFiles(directory=str(STATIC_DIR), html=True), name="ui")
 
-@app.get("/api/config-paths")
-async def config_paths():
-    return {
-        "presets": str(PRESETS_PATH),
-        "groups": str(GROUPS_PATH),
-    }
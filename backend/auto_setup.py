@@ -3,61 +3,85 @@
 # and (on Linux) optionally bring up vcan0 using pkexec if no hardware is present.
 
 from __future__ import annotations
+import asyncio
 import os, platform, socket, subprocess, shutil, sys, json
 from typing import Dict, Any
 
-def find_free_port(preferred: int = 8000, max_tries: int = 10) -> int:
+from bus import invalidate_socketcan_cache
+
+def find_free_port(preferred: int = 8000) -> int:
     """
-    Return a TCP port we can bind, preferring `preferred` and walking upward.
-    Avoids crashes when 8000 is already taken.
+    Return a TCP port we can bind, preferring `preferred`.
+    If it's taken, let the kernel pick one: bind to port 0 and read the
+    assignment back — one syscall round-trip, no probe loop.
     """
-    port = preferred
-    for _ in range(max_tries):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            try:
-                s.bind(("127.0.0.1", port))
-                return port  # it’s free
-            except OSError:
-                port += 1
-    return preferred  # last resort
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(("127.0.0.1", preferred))
+            return preferred  # it’s free
+        except OSError:
+            pass
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
 
 def _run(cmd: list[str]) -> subprocess.CompletedProcess:
     """Run a command, capture text output, never raise."""
     return subprocess.run(cmd, text=True, capture_output=True)
 
+# Platform and tool paths can't change under a running process; resolve once
+# instead of re-walking $PATH per call.
+_IS_LINUX = platform.system() == "Linux"
+_PKEXEC_PATH = shutil.which("pkexec") if _IS_LINUX else None
+
 def _is_linux() -> bool:
-    return platform.system() == "Linux"
+    return _IS_LINUX
+
+# /sys/class/net/<if>/type for CAN links (include/uapi/linux/if_arp.h)
+_ARPHRD_CAN = "280"
 
 def list_can_links() -> Dict[str, Any]:
     """
-    Enumerate CAN-like interfaces on Linux via `ip -br link`.
-    Returns dict: { "ifaces": ["can0","vcan0",...], "raw": "...output..." }
+    Enumerate CAN-like interfaces on Linux by scanning /sys/class/net —
+    no `ip` fork, just a directory walk and a one-line type read.
+    Returns dict: { "ifaces": ["can0","vcan0",...], "raw": "...summary..." }
     On non-Linux, returns empty list.
     """
     if not _is_linux():
         return {"ifaces": [], "raw": ""}
-    ip = shutil.which("ip")
-    if not ip:
-        return {"ifaces": [], "raw": "ip-not-found"}
-    cp = _run([ip, "-br", "link"])
     ifaces = []
-    for line in cp.stdout.splitlines():
-        name = line.split()[0]
-        if name.startswith("can") or name.startswith("vcan"):
+    try:
+        for e in os.scandir("/sys/class/net"):
+            name = e.name
+            if not name.startswith(("can", "vcan")):
+                continue
+            try:
+                with open(f"/sys/class/net/{name}/type") as f:
+                    if f.read().strip() != _ARPHRD_CAN:
+                        continue
+            except OSError:
+                # type unreadable: keep it, the prefix match is enough
+                pass
             ifaces.append(name)
-    return {"ifaces": ifaces, "raw": cp.stdout.strip()}
+    except OSError:
+        return {"ifaces": [], "raw": ""}
+    ifaces.sort()
+    return {"ifaces": ifaces, "raw": " ".join(ifaces)}
 
-def try_create_vcan_with_pkexec(vcan: str = "vcan0") -> Dict[str, Any]:
+async def try_create_vcan_with_pkexec(vcan: str = "vcan0") -> Dict[str, Any]:
     """
     Use pkexec (GUI privilege prompt) to:
       modprobe vcan; ip link add dev vcan0 type vcan || true; ip link set vcan0 up
     Returns a result dict with success, message, and logs.
+
+    Async on purpose: the prompt can sit open for many seconds, and the
+    event loop must keep serving requests meanwhile.
     """
     if not _is_linux():
         return {"success": False, "message": "Not Linux", "logs": {}}
 
-    pkexec = shutil.which("pkexec")
+    pkexec = _PKEXEC_PATH
     if not pkexec:
         return {
             "success": False,
@@ -71,25 +95,26 @@ def try_create_vcan_with_pkexec(vcan: str = "vcan0") -> Dict[str, Any]:
         f"ip link add dev {vcan} type vcan 2>/dev/null || true\n"
         f"ip link set {vcan} up\n"
     )
-    # Write a temporary script because pkexec runs an executable path.
-    import tempfile, stat
-    with tempfile.NamedTemporaryFile("w", delete=False, prefix="can-setup-", suffix=".sh") as f:
-        f.write("#!/usr/bin/env bash\n" + script)
-        tmp_path = f.name
-    os.chmod(tmp_path, os.stat(tmp_path).st_mode | stat.S_IXUSR)
-
-    # Run pkexec bash /tmp/script.sh (GUI password prompt appears on most desktops)
-    cp = _run([pkexec, "bash", tmp_path])
-    os.unlink(tmp_path)
-    if cp.returncode == 0:
-        return {"success": True, "message": "Created/started vcan0 using pkexec.", "logs": {"stdout": cp.stdout, "stderr": cp.stderr}}
+    # Inline the script with bash -c: no temp-file create/chmod/unlink, and
+    # pkexec shows the same GUI password prompt.
+    proc = await asyncio.create_subprocess_exec(
+        pkexec, "bash", "-c", script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, err = await proc.communicate()
+    stdout, stderr = out.decode(), err.decode()
+    if proc.returncode == 0:
+        # The fresh vcan must show up in the next discovery, not after the TTL.
+        invalidate_socketcan_cache()
+        return {"success": True, "message": "Created/started vcan0 using pkexec.", "logs": {"stdout": stdout, "stderr": stderr}}
     return {
         "success": False,
         "message": "pkexec failed or was canceled.",
-        "logs": {"stdout": cp.stdout, "stderr": cp.stderr, "returncode": cp.returncode},
+        "logs": {"stdout": stdout, "stderr": stderr, "returncode": proc.returncode},
     }
 
-def ensure_can_environment() -> Dict[str, Any]:
+async def ensure_can_environment() -> Dict[str, Any]:
     """
     High-level “make CAN usable” routine:
       - If Linux and any can*/vcan* exists → success immediately.
@@ -111,7 +136,7 @@ def ensure_can_environment() -> Dict[str, Any]:
 
     if _is_linux():
         # Try privileged vcan bring-up
-        vcan = try_create_vcan_with_pkexec("vcan0")
+        vcan = await try_create_vcan_with_pkexec("vcan0")
         if vcan["success"]:
             after = list_can_links()
             result.update({
@@ -2,15 +2,20 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import queue
+import selectors
+import socket
+import struct
 import time
 import threading
-import queue
+from collections import deque
 import subprocess
 import json
 import sys
 import importlib.util
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional, List, Tuple, Dict, Any
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -36,16 +41,173 @@ except Exception:
 # Common structures
 # ──────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
+    """RX frame as it leaves the reader thread.
+
+    The arbitration ID stays an int — hex formatting happens lazily in the
+    serializer, not at N-kHz RX rates. slots also trims per-instance size.
+    """
     ts: float
-    id_hex: str
+    arb_id: int
     data: bytes
 
+    @property
+    def id_hex(self) -> str:
+        return _hex_id(self.arb_id)
+
+
+# Byte-wise hex table: four indexed loads + concat skip the format-spec
+# machinery the old f-string paid per frame.
+_HEX8 = [f"{i:02X}" for i in range(256)]
+
+# Periodic TX traffic resends the same handful of IDs/payloads; a bounded
+# cache turns the per-send parse into a hash hit. bytes is immutable, so
+# sharing the cached payload is safe.
+@lru_cache(maxsize=1024)
+def _id_to_int(s: str) -> int:
+    return int(s, 16)
+
+@lru_cache(maxsize=1024)
+def _data_to_bytes(s: str) -> bytes:
+    return bytes.fromhex(s)
+
+
+# Shared empty payload: remote/zero-length frames shouldn't allocate.
+_EMPTY_BYTES = b""
+
+# Raw SocketCAN TX: struct.Struct packs the 16-byte kernel can_frame
+# (can_id|flags, dlc, pad, data — '8s' zero-pads short payloads) in C.
+_CAN_EFF_FLAG = 0x80000000
+_CAN_FRAME = struct.Struct("=IB3x8s")
 
 def _hex_id(i: int) -> str:
     """J1939 uses 29-bit (extended) IDs; print as 8 hex chars."""
-    return f"{i:08X}"
+    return (_HEX8[(i >> 24) & 0xFF] + _HEX8[(i >> 16) & 0xFF]
+            + _HEX8[(i >> 8) & 0xFF] + _HEX8[i & 0xFF])
+
+
+def _tune_io_thread() -> None:
+    """Best-effort scheduling tuning for the CAN I/O threads.
+
+    Opt-in: set CAN_RX_CPU to a core number to pin the calling thread there
+    and request SCHED_FIFO priority, cutting scheduling jitter at high frame
+    rates. SCHED_FIFO needs CAP_SYS_NICE, so every step degrades silently.
+    """
+    cpu = os.environ.get("CAN_RX_CPU")
+    if cpu is None:
+        return
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+    except (AttributeError, OSError):
+        pass
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Shared RX dispatcher
+# ──────────────────────────────────────────────────────────────────────────────
+
+class _RxDispatcher:
+    """One long-lived daemon thread drives RX for every open bus.
+
+    Buses register a drain callable — with their raw socket when they have
+    one (SocketCAN: epoll readiness wakeups), or without for backends that
+    only expose a poll API (Intrepid: serviced on a short timer branch).
+    Toggling buses in the UI no longer spawns and tears down a thread per
+    connect; one selector serves them all.
+    """
+
+    def __init__(self):
+        self._sel = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._polled: List[Any] = []
+        self._poll_hit = 0.0  # monotonic stamp of the last productive poll
+        self._thread: Optional[threading.Thread] = None
+        # Self-wakeup: register/unregister from other threads kicks the
+        # selector out of its park so membership changes apply immediately.
+        # socketpair rather than os.pipe: Windows' SelectSelector only
+        # accepts sockets, and sockets work with every selector backend.
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._sel.register(self._wake_r, selectors.EVENT_READ, self._drain_wake)
+
+    def _drain_wake(self) -> None:
+        try:
+            self._wake_r.recv(64)
+        except OSError:
+            pass
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
+
+    def register(self, drain: Any, sock: Any = None) -> None:
+        with self._lock:
+            if sock is not None:
+                self._sel.register(sock, selectors.EVENT_READ, drain)
+            else:
+                self._polled.append(drain)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="can-rx", daemon=True)
+                self._thread.start()
+            else:
+                self._wake()
+
+    def unregister(self, drain: Any, sock: Any = None) -> None:
+        with self._lock:
+            if sock is not None:
+                try:
+                    self._sel.unregister(sock)
+                except (KeyError, ValueError, OSError):
+                    pass
+            else:
+                try:
+                    self._polled.remove(drain)
+                except ValueError:
+                    pass
+            self._wake()
+
+    def _loop(self) -> None:
+        _tune_io_thread()
+        sel = self._sel
+        while True:
+            try:
+                # Poll-only backends get a load-adaptive timer: stay hot
+                # right after a burst, back off as the bus goes quiet. With
+                # only fd-backed buses, park indefinitely — the self-pipe
+                # wakes us for membership changes. Drains swallow their own
+                # errors, so a bus mid-close can't take the shared thread
+                # down.
+                if self._polled:
+                    idle = time.monotonic() - self._poll_hit
+                    if idle < 0.1:
+                        timeout = 0.0      # busy window: burst likely ongoing
+                    elif idle < 1.0:
+                        timeout = 0.0005   # cooling: yield between polls
+                    else:
+                        timeout = 0.005    # quiet: reclaim the core
+                else:
+                    timeout = None
+                for key, _ in sel.select(timeout):
+                    key.data()
+                hit = False
+                for drain in tuple(self._polled):
+                    if drain():
+                        hit = True
+                if hit:
+                    self._poll_hit = time.monotonic()
+            except Exception:
+                time.sleep(0.001)
+
+
+_rx_dispatcher = _RxDispatcher()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -61,31 +223,59 @@ class _SocketCANBus:
       (e.g., `ip link set can0 up type can bitrate 250000`).
     - RX runs on a lightweight thread to keep the event loop free.
     """
-    def __init__(self, channel: str, bitrate: Optional[int] = None):
+    def __init__(self, channel: str, bitrate: Optional[int] = None,
+                 on_rx: Optional[Any] = None, echo: bool = False):
         self.channel = channel
         self.bitrate = bitrate
+        self.echo = echo
         self.bus: Optional["can.BusABC"] = None
-        self._rxq: "queue.Queue[Frame]" = queue.Queue(maxsize=10000)
-        self._stop = threading.Event()
-        self._rx_thread: Optional[threading.Thread] = None
+        # Lock-free at the Python level: deque append/popleft are single
+        # C-level ops and maxlen gives drop-oldest for free.
+        self._rxq: "deque[Frame]" = deque(maxlen=10000)
+        self._rx_evt = threading.Event()
+        self._rx_sock: Any = None
+        self._tx_sock: Any = None
+        self._on_rx = on_rx  # called from the RX thread after each enqueue
         self.frames_total = 0
+        self.frames_dropped = 0  # oldest frames evicted by a full ring
         self.frames_by_pgn: Dict[int, int] = {}
 
     def open(self):
         if not HAS_PYCAN:
             raise RuntimeError("python-can not available")
         # Raises if channel doesn’t exist:
+        # Echo is opt-in: re-reading every TX frame doubles RX work during
+        # heavy transmission, so normal buses leave it off and selftest
+        # listens on a companion socket instead.
         self.bus = can.interface.Bus(
             channel=self.channel,
             bustype="socketcan",
-            receive_own_messages=True  # <— key for loopback echo on vcan
+            receive_own_messages=self.echo,
         )
-        self._start_rx()
+        # One reusable TX message, mutated in place under a lock: periodic
+        # senders stop churning a can.Message (+ its field objects) per frame.
+        self._tx_msg = can.Message(is_extended_id=True, arbitration_id=0, data=b"")
+        self._tx_lock = threading.Lock()
+        # Hot-path TX: pack the 16-byte kernel can_frame ourselves and write
+        # it straight to python-can's own raw socket — no per-send Message
+        # handling. Using the same socket keeps loopback semantics intact:
+        # other local sockets (candump, simulators, the selftest listener)
+        # still see our TX, while RECV_OWN_MSGS governs self-echo as before.
+        self._tx_sock = getattr(self.bus, "socket", None)
+        # Hand RX to the shared dispatcher: readiness-driven when python-can
+        # exposes the raw socket, timer-polled otherwise.
+        sock = getattr(self.bus, "socket", None)
+        try:
+            _rx_dispatcher.register(self._drain, sock)
+            self._rx_sock = sock
+        except (OSError, ValueError):
+            _rx_dispatcher.register(self._drain)
+            self._rx_sock = None
 
     def close(self):
-        self._stop.set()
-        if self._rx_thread:
-            self._rx_thread.join(timeout=1)
+        _rx_dispatcher.unregister(self._drain, self._rx_sock)
+        self._rx_sock = None
+        self._tx_sock = None  # python-can owns the socket; shutdown closes it
         if self.bus:
             try:
                 self.bus.shutdown()
@@ -96,54 +286,95 @@ class _SocketCANBus:
     def send(self, id_hex: str, data_hex: str):
         if not self.bus:
             raise RuntimeError("Bus not open")
-        arb = int(id_hex, 16)
-        data = bytes.fromhex(data_hex)
-        msg = can.Message(arbitration_id=arb, is_extended_id=True, data=data)
-        self.bus.send(msg)
-
-    def _start_rx(self):
-        def loop():
-            while not self._stop.is_set():
-                try:
-                    msg = self.bus.recv(0.02)  # type: ignore[attr-defined]
-                    if msg is None:
-                        continue
-                    ts = getattr(msg, "timestamp", time.time())
-                    data = bytes(getattr(msg, "data", b"") or b"")
-                    arb = int(getattr(msg, "arbitration_id", 0))
-                    frm = Frame(ts=ts, id_hex=_hex_id(arb), data=data)
-                    try:
-                        self._rxq.put_nowait(frm)
-                    except queue.Full:
-                        # Drop oldest to stay responsive under burst
-                        try:
-                            _ = self._rxq.get_nowait()
-                        except queue.Empty:
-                            pass
-                        try:
-                            self._rxq.put_nowait(frm)
-                        except queue.Full:
-                            pass
-                    self.frames_total += 1
-                except Exception:
-                    time.sleep(0.001)
-        self._rx_thread = threading.Thread(target=loop, daemon=True)
-        self._rx_thread.start()
+        arb = _id_to_int(id_hex)
+        data = _data_to_bytes(data_hex)
+        sock = self._tx_sock
+        if sock is not None:
+            # This tool speaks 29-bit J1939 IDs, so EFF is unconditional.
+            sock.send(_CAN_FRAME.pack(arb | _CAN_EFF_FLAG, len(data), data))
+            return
+        msg = self._tx_msg
+        with self._tx_lock:
+            msg.arbitration_id = arb
+            msg.data = data
+            msg.dlc = len(data)
+            self.bus.send(msg)
+
+    def _drain(self) -> bool:
+        """Pull everything the kernel has; runs on the shared RX thread.
+
+        Zero-timeout recvs drain a whole burst in one pass — one wakeup and
+        one deque extend per burst instead of per frame. Returns True when
+        frames arrived (feeds the dispatcher's adaptive poll timer).
+        """
+        bus = self.bus
+        if bus is None:
+            return False
+        try:
+            msg = bus.recv(0.0)  # type: ignore[attr-defined]
+            if msg is None:
+                return False
+            batch = [msg]
+            while True:
+                m = bus.recv(0.0)  # type: ignore[attr-defined]
+                if m is None:
+                    break
+                batch.append(m)
+            now = time.time()
+            frames = []
+            for m in batch:
+                raw = getattr(m, "data", None)
+                frames.append(Frame(
+                    ts=getattr(m, "timestamp", now),
+                    arb_id=int(getattr(m, "arbitration_id", 0)),
+                    # One copy out of the driver's bytearray; the
+                    # shared empty avoids allocating for RTR frames.
+                    data=bytes(raw) if raw else _EMPTY_BYTES,
+                ))
+            q = self._rxq
+            # deque(maxlen) silently evicts the oldest on overflow; count the
+            # evictions so health() shows true overflow rates.
+            overflow = len(q) + len(frames) - q.maxlen
+            if overflow > 0:
+                self.frames_dropped += overflow
+            q.extend(frames)
+            self._rx_evt.set()
+            self.frames_total += len(frames)
+            if self._on_rx is not None:
+                self._on_rx()
+            return True
+        except Exception:
+            return False
 
     def read_batch(self, max_items: int) -> List[Frame]:
-        out: List[Frame] = []
-        while len(out) < max_items:
-            try:
-                out.append(self._rxq.get_nowait())
-            except queue.Empty:
-                break
-        return out
+        # Size-based bulk pop: len() is exact under the GIL for the single
+        # consumer, so no exception-driven loop is needed.
+        q = self._rxq
+        pop = q.popleft
+        return [pop() for _ in range(min(max_items, len(q)))]
+
+    def read_batch_blocking(self, timeout: float, max_items: int) -> List[Frame]:
+        """Park on the queue until the first frame (or timeout), then drain.
+
+        One thread-park replaces the caller-side sleep loop: arrival latency
+        is microseconds instead of up to a whole poll interval.
+        """
+        out = self.read_batch(max_items)
+        if out:
+            return out
+        if not self._rx_evt.wait(timeout):
+            return out
+        self._rx_evt.clear()
+        # Drain after clearing so frames appended while the event was still
+        # set can't miss their wakeup.
+        return self.read_batch(max_items)
 
     def health(self) -> Dict[str, Any]:
         return {
             "driver": "socketcan",
             "channel": self.channel,
             "frames_total": self.frames_total,
+            "frames_dropped": self.frames_dropped,
         }
 
 
@@ -153,15 +384,19 @@ class _SocketCANBus:
 
 class _IntrepidBus:
     """libicsneo wrapper with a compatible API."""
-    def __init__(self, device_index: int, bitrate: Optional[int] = None):
+    def __init__(self, device_index: int, bitrate: Optional[int] = None,
+                 on_rx: Optional[Any] = None):
         self.device_index = device_index
         self.bitrate = bitrate
         self.dev: Optional["ics.Device"] = None
         self._net = ics.Network.NetID.CAN1
-        self._rxq: "queue.Queue[Frame]" = queue.Queue(maxsize=10000)
-        self._stop = threading.Event()
-        self._rx_thread: Optional[threading.Thread] = None
+        # Lock-free at the Python level: deque append/popleft are single
+        # C-level ops and maxlen gives drop-oldest for free.
+        self._rxq: "deque[Frame]" = deque(maxlen=10000)
+        self._rx_evt = threading.Event()
+        self._on_rx = on_rx
         self.frames_total = 0
+        self.frames_dropped = 0  # oldest frames evicted by a full ring
 
     @staticmethod
     def list_names() -> List[str]:
@@ -192,12 +427,12 @@ class _IntrepidBus:
             except Exception:
                 pass
         self.dev.enable_bus(self._net, True)
-        self._start_rx()
+        # No readable fd from libicsneo — the dispatcher polls our drain
+        # on its timer branch.
+        _rx_dispatcher.register(self._drain)
 
     def close(self):
-        self._stop.set()
-        if self._rx_thread:
-            self._rx_thread.join(timeout=1)
+        _rx_dispatcher.unregister(self._drain)
         if self.dev:
             try:
                 self.dev.enable_bus(self._net, False)
@@ -210,36 +445,72 @@ class _IntrepidBus:
         if not self.dev:
             raise RuntimeError("Device not open")
         msg = ics.CanMessage()
-        msg.arb_id = int(id_hex, 16)
+        msg.arb_id = _id_to_int(id_hex)
         msg.is_extended = True
-        msg.data = bytearray.fromhex(data_hex)
+        msg.data = bytearray(_data_to_bytes(data_hex))
         ok = self.dev.transmit(msg)
         if not ok:
             raise RuntimeError("TX failed")
 
-    def _start_rx(self):
-        def loop():
-            while not self._stop.is_set():
-                try:
-                    msgs = self.dev.receive()  # returns list
-                    ts = time.time()
-                    for m in msgs:
-                        data = bytes(m.data or b"")
-                        self._rxq.put_nowait(Frame(ts=ts, id_hex=_hex_id(int(m.arb_id)), data=data))
-                        self.frames_total += 1
-                except Exception:
-                    time.sleep(0.001)
-        self._rx_thread = threading.Thread(target=loop, daemon=True)
-        self._rx_thread.start()
+    def _drain(self) -> bool:
+        """Poll the device once; runs on the shared RX thread.
+
+        Returns True when messages arrived — that feeds the dispatcher's
+        adaptive poll timer.
+        """
+        dev = self.dev
+        if dev is None:
+            return False
+        try:
+            msgs = dev.receive()  # returns list
+            if not msgs:
+                return False
+            ts = time.time()
+            q = self._rxq
+            maxlen = q.maxlen
+            # Hoisted lookups: at burst rates the per-message attribute and
+            # method resolution adds up.
+            append = q.append
+            mk = Frame
+            dropped = 0
+            for m in msgs:
+                raw = m.data
+                if len(q) == maxlen:
+                    dropped += 1
+                append(mk(ts=ts, arb_id=int(m.arb_id),
+                          data=bytes(raw) if raw else _EMPTY_BYTES))
+            if dropped:
+                self.frames_dropped += dropped
+            self.frames_total += len(msgs)
+            self._rx_evt.set()
+            if self._on_rx is not None:
+                self._on_rx()
+            return True
+        except Exception:
+            return False
 
     def read_batch(self, max_items: int) -> List[Frame]:
-        out: List[Frame] = []
-        while len(out) < max_items:
-            try:
-                out.append(self._rxq.get_nowait())
-            except queue.Empty:
-                break
-        return out
+        # Size-based bulk pop: len() is exact under the GIL for the single
+        # consumer, so no exception-driven loop is needed.
+        q = self._rxq
+        pop = q.popleft
+        return [pop() for _ in range(min(max_items, len(q)))]
+
+    def read_batch_blocking(self, timeout: float, max_items: int) -> List[Frame]:
+        """Park on the queue until the first frame (or timeout), then drain.
+
+        One thread-park replaces the caller-side sleep loop: arrival latency
+        is microseconds instead of up to a whole poll interval.
+        """
+        out = self.read_batch(max_items)
+        if out:
+            return out
+        if not self._rx_evt.wait(timeout):
+            return out
+        self._rx_evt.clear()
+        # Drain after clearing so frames appended while the event was still
+        # set can't miss their wakeup.
+        return self.read_batch(max_items)
 
     def health(self) -> Dict[str, Any]:
         name = ""
@@ -252,6 +523,7 @@ class _IntrepidBus:
             "device_index": self.device_index,
             "device": name,
             "frames_total": self.frames_total,
+            "frames_dropped": self.frames_dropped,
         }
 
 
@@ -266,7 +538,8 @@ class _KvaserBus:
         return [f"kvaser{i}" for i in range(4)]
 
     async def connect(self, channel: str, bitrate: int):
-        import can  # python-can
+        if not HAS_PYCAN:
+            return False, "python-can not available"
         try:
             if not channel.lower().startswith("kvaser"):
                 return False, f"invalid channel name '{channel}'. use 'kvaser0', 'kvaser1', etc."
@@ -299,14 +572,28 @@ class _KvaserBus:
 # Helpers for SocketCAN discovery (fast & non-blocking for the API thread)
 # ──────────────────────────────────────────────────────────────────────────────
 
+# CAN links change rarely; a short TTL absorbs UI refresh bursts without
+# forking `ip` each time. auto_setup invalidates after creating a vcan.
+_IFACE_CACHE_TTL = 2.0
+_iface_cache: Dict[str, Any] = {"t": 0.0, "v": []}
+
+def invalidate_socketcan_cache() -> None:
+    """Drop the cached interface list (call after creating/removing links)."""
+    _iface_cache["t"] = 0.0
+
 def _list_socketcan_names() -> List[str]:
     """
     Return available SocketCAN interface names quickly.
 
     Strategy:
+      0) TTL cache (~2 s) so repeat discovery is a dict lookup
       1) Preferred: `ip -details -json link show type can` (timeout 1s)
       2) Fallback: scan /sys/class/net for interfaces starting with can* or vcan*
     """
+    now = time.monotonic()
+    if now - _iface_cache["t"] < _IFACE_CACHE_TTL:
+        return _iface_cache["v"]
+
     names: List[str] = []
 
     # Preferred: `ip` JSON output
@@ -326,12 +613,14 @@ def _list_socketcan_names() -> List[str]:
     except Exception:
         pass
 
-    # Fallback: /sys scan
+    # Fallback: /sys scan (scandir: one getdents pass, no pattern matching
+    # or per-entry stat like glob)
     try:
-        for p in Path("/sys/class/net").glob("*"):
-            n = p.name
-            if n.startswith(("can", "vcan")):
-                names.append(n)
+        with os.scandir("/sys/class/net") as it:
+            for e in it:
+                n = e.name
+                if n.startswith(("can", "vcan")):
+                    names.append(n)
     except Exception:
         pass
 
@@ -342,9 +631,87 @@ def _list_socketcan_names() -> List[str]:
         if n not in seen:
             seen.add(n)
             uniq.append(n)
+    _iface_cache["t"] = now
+    _iface_cache["v"] = uniq
     return uniq
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# TX worker
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _fut_ok(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+def _fut_err(fut: asyncio.Future, e: BaseException) -> None:
+    if not fut.done():
+        fut.set_exception(e)
+
+
+class _TxWorker:
+    """Per-connection TX thread.
+
+    Driver send() can block on a full TX buffer (ENOBUFS on SocketCAN,
+    device queues on Intrepid); running it here keeps the event loop
+    responsive. Callers get a per-send future resolved from the worker via
+    call_soon_threadsafe.
+    """
+
+    def __init__(self, send: Any):
+        self._send = send
+        self._q: "queue.SimpleQueue" = queue.SimpleQueue()
+        # Orders submit() against stop(): once the sentinel is queued no item
+        # can land behind it, so no future is ever left unresolved.
+        self._state_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._loop, name="can-tx", daemon=True)
+        self._thread.start()
+
+    def submit(self, loop: asyncio.AbstractEventLoop,
+               id_hex: str, data_hex: str) -> asyncio.Future:
+        fut = loop.create_future()
+        with self._state_lock:
+            if self._closed:
+                raise RuntimeError("Not connected")
+            self._q.put((loop, fut, id_hex, data_hex))
+        return fut
+
+    def stop(self) -> None:
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._q.put(None)
+
+    def _loop(self) -> None:
+        _tune_io_thread()
+        q = self._q
+        send = self._send
+        while True:
+            item = q.get()
+            if item is None:
+                # Defensive drain: fail anything still queued rather than
+                # leaving its future pending forever.
+                while True:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        return
+                    if item is None:
+                        continue
+                    loop, fut, _, _ = item
+                    loop.call_soon_threadsafe(
+                        _fut_err, fut, RuntimeError("Bus disconnected"))
+            loop, fut, id_hex, data_hex = item
+            try:
+                send(id_hex, data_hex)
+            except Exception as e:
+                loop.call_soon_threadsafe(_fut_err, fut, e)
+            else:
+                loop.call_soon_threadsafe(_fut_ok, fut)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Front-end facing manager (adds _lock/_bus/_info and avoids pre-instantiation)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -354,21 +721,43 @@ class BusManager:
         # Runtime state guarded by _lock
         self._bus = None                      # active low-level bus
         self._info: Dict[str, Any] = {}       # metadata for /health
-        self._lock = asyncio.Lock()           # prevents concurrent connect/disconnect
+        self._lock = asyncio.Lock()           # guards pointer swaps only
+        self._connecting = False              # one connect in flight at a time
+        # Wakeup for event-driven RX waits: set (via the loop) by the reader
+        # thread when frames arrive, so waiters never poll at idle.
+        self._rx_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tx: Optional[_TxWorker] = None
+
+    def _make_rx_wakeup(self):
+        """Build the cross-thread wakeup callback for a fresh connection."""
+        loop = asyncio.get_running_loop()
+        ev = asyncio.Event()
+        old = self._rx_event
+        self._loop, self._rx_event = loop, ev
+        # Release waiters parked on the previous connection's event —
+        # nothing will ever set it again, and wait_rx_batch re-reads
+        # self._rx_event each pass, so woken waiters pick up this one.
+        if old is not None:
+            old.set()
+        def wake():
+            # is_set() is a plain bool read: cheap enough to check from the
+            # RX thread and skip the call_soon_threadsafe once armed.
+            if not ev.is_set():
+                loop.call_soon_threadsafe(ev.set)
+        return wake
 
     # ---- Discovery -----------------------------------------------------------
 
     async def discover_interfaces(self) -> List[str]:
-        tasks = [
-            asyncio.to_thread(_list_socketcan_names),
-            asyncio.to_thread(_IntrepidBus.list_names) if HAS_INTREPID else None,
+        tasks = [asyncio.to_thread(_list_socketcan_names)]
+        if HAS_INTREPID:
+            tasks.append(asyncio.to_thread(_IntrepidBus.list_names))
+        # Concurrent probes: total latency is the slowest backend, not the sum.
+        groups = await asyncio.gather(*tasks, return_exceptions=True)
+        results: List[List[str]] = [
+            g if isinstance(g, list) else [] for g in groups
         ]
-        results: List[List[str]] = []
-        for t in [t for t in tasks if t is not None]:
-            try:
-                results.append(await t)  # type: ignore[arg-type]
-            except Exception:
-                results.append([])
 
         out: List[str] = []
         seen: set[str] = set()
@@ -381,87 +770,162 @@ class BusManager:
 
     # ---- Connect / Disconnect ----------------------------------------------
 
-    async def _disconnect_no_lock(self) -> None:
-        """Close current bus without acquiring _lock (caller must hold it)."""
-        if self._bus is not None:
+    def _detach_locked(self):
+        """Swap out the current bus/tx pointers; caller must hold _lock."""
+        bus, self._bus = self._bus, None
+        tx, self._tx = self._tx, None
+        self._info = {}
+        return bus, tx
+
+    @staticmethod
+    async def _close_detached(bus, tx) -> None:
+        """Tear down an already-detached bus/tx pair off the event loop."""
+        if tx is not None:
+            tx.stop()
+        if bus is not None:
             try:
-                await asyncio.to_thread(self._bus.close)  # type: ignore[attr-defined]
+                await asyncio.to_thread(bus.close)  # type: ignore[attr-defined]
             except Exception:
                 pass
-            self._bus = None
-            self._info = {}
 
     async def connect(self, channel: str, bitrate: Optional[int] = None) -> Tuple[bool, str]:
         """
         Connect to either SocketCAN (default) or Intrepid if channel starts with 'intrepid'.
-        Offloads hardware open to a thread to avoid blocking the event loop.
+
+        The lock is held only around pointer swaps; hardware open/close runs
+        in worker threads with the lock released, so health/discovery calls
+        aren't serialized behind slow device I/O. A _connecting flag keeps
+        connects themselves one-at-a-time.
         """
         async with self._lock:
-            await self._disconnect_no_lock()
-            try:
-                if channel.startswith("intrepid"):
-                    if not HAS_INTREPID:
-                        return False, "Intrepid library not available"
-                    idx = int(channel.replace("intrepid", "") or "0")
-                    b = _IntrepidBus(device_index=idx, bitrate=bitrate)
-                    await asyncio.to_thread(b.open)
-                    self._bus = b
-                    name = ""
-                    try:
-                        name = b.dev.get_product_name()
-                    except Exception:
-                        pass
-                    self._info = {
-                        "driver": "intrepid",
-                        "device": name,
-                        "channel": f"intrepid{idx}",
-                        "connected_at": time.time(),
-                    }
-                    return True, "connected (intrepid)"
-                else:
-                    if not HAS_PYCAN:
-                        return False, "python-can not available"
-                    b = _SocketCANBus(channel=channel, bitrate=bitrate)
-                    await asyncio.to_thread(b.open)
-                    self._bus = b
-                    self._info = {
-                        "driver": "socketcan",
-                        "channel": channel,
-                        "connected_at": time.time(),
-                    }
-                    return True, "connected (socketcan)"
-            except Exception as e:
-                self._bus = None
-                self._info = {}
-                return False, str(e)
+            if self._connecting:
+                return False, "connect already in progress"
+            self._connecting = True
+            old = self._detach_locked()
+        try:
+            await self._close_detached(*old)
+            if channel.startswith("intrepid"):
+                if not HAS_INTREPID:
+                    return False, "Intrepid library not available"
+                idx = int(channel.replace("intrepid", "") or "0")
+                b = _IntrepidBus(device_index=idx, bitrate=bitrate,
+                                 on_rx=self._make_rx_wakeup())
+                await asyncio.to_thread(b.open)
+                name = ""
+                try:
+                    name = b.dev.get_product_name()
+                except Exception:
+                    pass
+                info = {
+                    "driver": "intrepid",
+                    "device": name,
+                    "channel": f"intrepid{idx}",
+                    "connected_at": time.time(),
+                }
+                msg = "connected (intrepid)"
+            else:
+                if not HAS_PYCAN:
+                    return False, "python-can not available"
+                b = _SocketCANBus(channel=channel, bitrate=bitrate,
+                                  on_rx=self._make_rx_wakeup())
+                await asyncio.to_thread(b.open)
+                info = {
+                    "driver": "socketcan",
+                    "channel": channel,
+                    "connected_at": time.time(),
+                }
+                msg = "connected (socketcan)"
+            async with self._lock:
+                self._bus = b
+                self._tx = _TxWorker(b.send)
+                self._info = info
+            return True, msg
+        except Exception as e:
+            return False, str(e)
+        finally:
+            self._connecting = False
 
     async def disconnect(self):
         async with self._lock:
-            await self._disconnect_no_lock()
+            old = self._detach_locked()
+        await self._close_detached(*old)
 
     # ---- I/O ----------------------------------------------------------------
 
     async def send(self, id_hex: str, data_hex: str):
-        if self._bus is None:
+        tx = self._tx
+        if tx is None:
             raise RuntimeError("Not connected")
-        self._bus.send(id_hex, data_hex)  # type: ignore[attr-defined]
+        # Awaiting the future keeps the driver's blocking send off the loop.
+        await tx.submit(asyncio.get_running_loop(), id_hex, data_hex)
+
+    async def send_many(self, items: List[Tuple[str, str]]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Issue a burst of frames in one pass: all submitted to the TX worker
+        up front, then awaited together. Returns (ok, error) per frame,
+        in order.
+        """
+        tx = self._tx
+        if tx is None:
+            return [(False, "Not connected")] * len(items)
+        loop = asyncio.get_running_loop()
+        # submit() raises once the worker is stopped (disconnect race); record
+        # that per frame so already-queued futures still get awaited.
+        futs: List[Any] = []
+        for id_hex, data_hex in items:
+            try:
+                futs.append(tx.submit(loop, id_hex, data_hex))
+            except Exception as e:
+                futs.append(e)
+        results: List[Tuple[bool, Optional[str]]] = []
+        for fut in futs:
+            if isinstance(fut, Exception):
+                results.append((False, str(fut)))
+                continue
+            try:
+                await fut
+                results.append((True, None))
+            except Exception as e:
+                results.append((False, str(e)))
+        return results
+
+    def read_rx_nowait(self, max_items: int) -> List[Frame]:
+        """Non-blocking drain of whatever is already buffered (may be empty)."""
+        if self._bus is None:
+            return []
+        return self._bus.read_batch(max_items)  # type: ignore[attr-defined]
+
+    async def wait_rx_batch(self, max_items: int) -> List[Frame]:
+        """
+        Await the next batch with no polling: the RX thread arms an
+        asyncio.Event on arrival, so an idle stream does zero wakeups.
+        """
+        while True:
+            items = self.read_rx_nowait(max_items)
+            if items:
+                return items
+            ev = self._rx_event
+            if ev is None:
+                # Not connected yet — nothing will ever signal; poll slowly.
+                await asyncio.sleep(0.2)
+                continue
+            ev.clear()
+            # Re-drain after clearing: frames enqueued while the event was
+            # still set would otherwise miss their wakeup.
+            items = self.read_rx_nowait(max_items)
+            if items:
+                return items
+            await ev.wait()
 
     async def get_rx_batch(self, timeout: float, max_items: int) -> List[Frame]:
         """
         Collect up to max_items frames, waiting up to 'timeout' seconds.
-        Polls in small sleeps to hit ~50–100 Hz cadence without blocking the loop.
+        Blocks on the queue in a worker thread — no sleep-loop wakeups.
         """
-        end = time.time() + timeout
-        items: List[Frame] = []
-        while time.time() < end:
-            if self._bus is None:
-                break
-            batch = self._bus.read_batch(max_items)  # type: ignore[attr-defined]
-            if batch:
-                items.extend(batch)
-                break
-            await asyncio.sleep(0.01)
-        return items
+        bus = self._bus
+        if bus is None:
+            return []
+        return await asyncio.to_thread(bus.read_batch_blocking, timeout, max_items)  # type: ignore[attr-defined]
 
     # ---- Health / Self-test -------------------------------------------------
 
@@ -489,42 +953,64 @@ class BusManager:
 
         test_id_hex = "18F11CEF"
         test_data_hex = "A55A55A55A55A55A"
+        # Compare in native form: no hex round-trip per received frame.
+        test_id = int(test_id_hex, 16)
+        test_data = bytes.fromhex(test_data_hex)
+
+        # The main bus runs with echo off, so listen on a short-lived
+        # companion socket: SocketCAN loops our TX back to other sockets on
+        # the same channel by default.
+        listener: Optional[_SocketCANBus] = None
+        if isinstance(self._bus, _SocketCANBus):
+            try:
+                listener = _SocketCANBus(channel=self._bus.channel, echo=True)
+                await asyncio.to_thread(listener.open)
+            except Exception:
+                listener = None
+        rx_src = listener if listener is not None else self._bus
 
-        # Drain any old frames quickly so we don't count stale traffic
-        try:
-            _ = self._bus.read_batch(10000)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-
-        tx_ok = False
         try:
-            self._bus.send(test_id_hex, test_data_hex)  # type: ignore[attr-defined]
-            tx_ok = True
-        except Exception as e:
-            return {"connected": True, "tx_ok": False, "error": str(e)}
-
-        # Wait briefly for echo
-        deadline = time.time() + (timeout_ms / 1000.0)
-        echo_rx = False
-        rx_seen = 0
-        while time.time() < deadline:
+            # Drain any old frames quickly so we don't count stale traffic
             try:
-                b = self._bus.read_batch(1000)  # type: ignore[attr-defined]
+                _ = rx_src.read_batch(10000)  # type: ignore[attr-defined]
             except Exception:
-                b = []
-            rx_seen += len(b)
-            for fr in b:
-                if fr.id_hex.upper() == test_id_hex and fr.data.hex().upper() == test_data_hex:
-                    echo_rx = True
-                    break
-            if echo_rx:
-                break
-            await asyncio.sleep(0.01)
+                pass
 
-        return {
-            "connected": True,
-            "tx_ok": tx_ok,
-            "echo_rx": echo_rx,
-            "rx_seen": rx_seen,
-            "note": "Echo depends on loopback/other node. vcan will echo; hardware may not.",
-        }
+            tx_ok = False
+            try:
+                self._bus.send(test_id_hex, test_data_hex)  # type: ignore[attr-defined]
+                tx_ok = True
+            except Exception as e:
+                return {"connected": True, "tx_ok": False, "error": str(e)}
+
+            # Wait briefly for echo (monotonic: immune to wall-clock steps)
+            deadline = time.monotonic() + (timeout_ms / 1000.0)
+            echo_rx = False
+            rx_seen = 0
+            while time.monotonic() < deadline:
+                try:
+                    b = rx_src.read_batch(1000)  # type: ignore[attr-defined]
+                except Exception:
+                    b = []
+                rx_seen += len(b)
+                for fr in b:
+                    if fr.arb_id == test_id and fr.data == test_data:
+                        echo_rx = True
+                        break
+                if echo_rx:
+                    break
+                await asyncio.sleep(0.01)
+
+            return {
+                "connected": True,
+                "tx_ok": tx_ok,
+                "echo_rx": echo_rx,
+                "rx_seen": rx_seen,
+                "note": "Echo depends on loopback/other node. vcan will echo; hardware may not.",
+            }
+        finally:
+            if listener is not None:
+                try:
+                    await asyncio.to_thread(listener.close)
+                except Exception:
+                    pass
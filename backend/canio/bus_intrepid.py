@@ -1,9 +1,14 @@
 # backend/canio/bus_intrepid.py
 from __future__ import annotations
-import threading, queue, time
-from typing import Optional, Dict, Any, List
+import threading, time
+from collections import deque
+from typing import Optional, List, Tuple
 import icsneopy as ics
 
+# RX queue entries: (ts, arb_id, is_extended, data). Raw bytes stay raw on
+# the hot path — hex-encode at serialization time, not per received frame.
+RxItem = Tuple[float, int, bool, bytes]
+
 class IntrepidBus:
     """
     Minimal wrapper that makes libicsneo behave like our socketcan bus.
@@ -15,7 +20,9 @@ class IntrepidBus:
         self.device_index = device_index
         self.bitrate = bitrate
         self.dev: Optional[ics.Device] = None
-        self._rxq: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=10000)
+        # deque over queue.Queue: C-level append/popleft with no per-item
+        # lock, and maxlen gives drop-oldest on overflow for free.
+        self._rxq: "deque[RxItem]" = deque(maxlen=10000)
         self._stop = threading.Event()
         self._rx_thread: Optional[threading.Thread] = None
         self._net = ics.Network.NetID.CAN1  # default to CAN1
@@ -80,25 +87,19 @@ class IntrepidBus:
                 try:
                     msgs = self.dev.receive()  # returns a list
                     ts = time.time()
+                    # Hoisted lookup: one append resolution per burst.
+                    append = self._rxq.append
                     for m in msgs:
                         payload = bytes(m.data or b"")
-                        self._rxq.put_nowait({
-                            "ts": ts,
-                            "id": int(m.arb_id),
-                            "is_extended": bool(m.is_extended),
-                            "dlc": len(payload),
-                            "data_hex": payload.hex().upper(),
-                        })
+                        append((ts, int(m.arb_id), bool(m.is_extended), payload))
                 except Exception:
                     time.sleep(0.001)
         self._rx_thread = threading.Thread(target=loop, daemon=True)
         self._rx_thread.start()
 
-    def read_batch(self, max_items: int = 1000) -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
-        while len(out) < max_items:
-            try:
-                out.append(self._rxq.get_nowait())
-            except queue.Empty:
-                break
-        return out
+    def read_batch(self, max_items: int = 1000) -> List[RxItem]:
+        # Size-based bulk pop: len() is exact under the GIL for the single
+        # consumer, so no exception-driven loop is needed.
+        q = self._rxq
+        pop = q.popleft
+        return [pop() for _ in range(min(max_items, len(q)))]
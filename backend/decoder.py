@@ -1,4 +1,20 @@
-from typing import Dict, Any
+from typing import Dict, Any, Callable, NamedTuple
+
+class Decoded(NamedTuple):
+    """decode_frame result; attribute access beats dict.get on hot paths."""
+    pgn: Any
+    sa: Any
+    decoded: Dict[str, Any]
+
+_EMPTY = Decoded(None, None, {})
+_NO_FIELDS: Dict[str, Any] = {}
+
+# Optional compiled fast path (backend/_decoder.pyx, built with
+# `cythonize -i _decoder.pyx`); same contract, pure-Python fallback below.
+try:
+    from _decoder import decode_one as _c_decode_one  # type: ignore
+except Exception:
+    _c_decode_one = None
 
 def safe_hex(data: bytes) -> str:
     return data.hex().upper()
@@ -6,52 +22,91 @@ def safe_hex(data: bytes) -> str:
 def _u16(lo:int, hi:int)->int:
     return (hi<<8)|lo
 
+# Branchless PGN selection: PDU2 (pdu_format >= 240) keeps the pdu_specific
+# byte, PDU1 masks it out. One cache-hot bytes index replaces the per-frame
+# comparison branch.
+_PS_MASK = bytes(0xFF if f >= 240 else 0 for f in range(256))
+
 def _is_na(b:int)->bool:
     return b==0xFF
 
-def decode_frame(fr)->Dict[str,Any]:
+# Per-PGN decoders: each takes the payload padded to 8 bytes and returns the
+# decoded fields. Splitting the old if-chain lets dispatch be one dict hit
+# and unknown PGNs (most frames on a loaded bus) skip decoding entirely.
+
+def _decode_65253(b: bytes) -> Dict[str, Any]:
+    raw=b[0]|(b[1]<<8)|(b[2]<<16)|(b[3]<<24)
+    return {'Engine Hours (h)': 'N/A' if 0xFF in b[0:4] else round(raw*0.05,3)}
+
+def _decode_65262(b: bytes) -> Dict[str, Any]:
+    d={}
+    d['Coolant Temp (°C)']='N/A' if _is_na(b[0]) else (b[0]-40)
+    d['Fuel Temp (°C)']='N/A' if _is_na(b[1]) else (b[1]-40)
+    if _is_na(b[2]) or _is_na(b[3]): d['Oil Temp (°C)']='N/A'
+    else:
+        raw=_u16(b[2],b[3])
+        d['Oil Temp (°C)']=round((raw/32.0)-273.0,3)
+    return d
+
+def _decode_65263(b: bytes) -> Dict[str, Any]:
+    d={}
+    d['Fuel Delivery Pressure (kPa)']='N/A' if _is_na(b[0]) else b[0]*4
+    d['Engine Oil Pressure (kPa)']='N/A' if _is_na(b[3]) else b[3]*4
+    d['Coolant Pressure (kPa)']='N/A' if _is_na(b[6]) else b[6]*2
+    d['Coolant Level (%)']='N/A' if _is_na(b[7]) else round(b[7]*0.4,3)
+    return d
+
+def _decode_65272(b: bytes) -> Dict[str, Any]:
+    d={}
+    d['Trans Oil Pressure (kPa)']='N/A' if _is_na(b[3]) else b[3]*16
+    if _is_na(b[4]) or _is_na(b[5]): d['Trans Oil Temp (°C)']='N/A'
+    else:
+        raw=_u16(b[4],b[5])
+        d['Trans Oil Temp (°C)']=round((raw/32.0)-273.0,3)
+    return d
+
+def _decode_65266(b: bytes) -> Dict[str, Any]:
+    d={}
+    if _is_na(b[0]) or _is_na(b[1]): d['Fuel Rate (L/h)']='N/A'
+    else:
+        raw=_u16(b[0],b[1])
+        d['Fuel Rate (L/h)']=round(raw*0.05,3)
+    if _is_na(b[4]) or _is_na(b[5]): d['Avg Fuel Economy (km/L)']='N/A'
+    else:
+        raw=_u16(b[4],b[5])
+        d['Avg Fuel Economy (km/L)']=round(raw/512.0,3)
+    return d
+
+def _decode_65276(b: bytes) -> Dict[str, Any]:
+    return {'Fuel Level (%)': 'N/A' if _is_na(b[1]) else round(b[1]*0.4,3)}
+
+def _decode_61443(b: bytes) -> Dict[str, Any]:
+    return {'Engine Load (%)': 'N/A' if _is_na(b[2]) else b[2]*1.0}
+
+_PGN_DECODERS: Dict[int, Callable[[bytes], Dict[str, Any]]] = {
+    65253: _decode_65253,
+    65262: _decode_65262,
+    65263: _decode_65263,
+    65272: _decode_65272,
+    65266: _decode_65266,
+    65276: _decode_65276,
+    61443: _decode_61443,
+}
+
+def decode_frame(fr)->Decoded:
     try:
-        arb=int(fr.id_hex,16)
+        arb=fr.arb_id
     except Exception:
-        return {'pgn':None,'sa':None,'decoded':{}}
+        return _EMPTY
+    if _c_decode_one is not None:
+        pgn,sa,d=_c_decode_one(arb,fr.data)
+        return Decoded(pgn,sa,d)
     pdu_format=(arb>>16)&0xFF
-    pdu_specific=(arb>>8)&0xFF
     sa=arb&0xFF
-    pgn=(pdu_format<<8)|pdu_specific if pdu_format>=240 else (pdu_format<<8)
-    b=list(fr.data)+[0]*(8-len(fr.data))
-    d={}
-    if pgn==65253:
-        raw=b[0]|(b[1]<<8)|(b[2]<<16)|(b[3]<<24)
-        d['Engine Hours (h)']='N/A' if 0xFF in b[0:4] else round(raw*0.05,3)
-    if pgn==65262:
-        d['Coolant Temp (°C)']='N/A' if _is_na(b[0]) else (b[0]-40)
-        d['Fuel Temp (°C)']='N/A' if _is_na(b[1]) else (b[1]-40)
-        if _is_na(b[2]) or _is_na(b[3]): d['Oil Temp (°C)']='N/A'
-        else:
-            raw=_u16(b[2],b[3])
-            d['Oil Temp (°C)']=round((raw/32.0)-273.0,3)
-    if pgn==65263:
-        d['Fuel Delivery Pressure (kPa)']='N/A' if _is_na(b[0]) else b[0]*4
-        d['Engine Oil Pressure (kPa)']='N/A' if _is_na(b[3]) else b[3]*4
-        d['Coolant Pressure (kPa)']='N/A' if _is_na(b[6]) else b[6]*2
-        d['Coolant Level (%)']='N/A' if _is_na(b[7]) else round(b[7]*0.4,3)
-    if pgn==65272:
-        d['Trans Oil Pressure (kPa)']='N/A' if _is_na(b[3]) else b[3]*16
-        if _is_na(b[4]) or _is_na(b[5]): d['Trans Oil Temp (°C)']='N/A'
-        else:
-            raw=_u16(b[4],b[5])
-            d['Trans Oil Temp (°C)']=round((raw/32.0)-273.0,3)
-    if pgn==65266:
-        if _is_na(b[0]) or _is_na(b[1]): d['Fuel Rate (L/h)']='N/A'
-        else:
-            raw=_u16(b[0],b[1])
-            d['Fuel Rate (L/h)']=round(raw*0.05,3)
-        if _is_na(b[4]) or _is_na(b[5]): d['Avg Fuel Economy (km/L)']='N/A'
-        else:
-            raw=_u16(b[4],b[5])
-            d['Avg Fuel Economy (km/L)']=round(raw/512.0,3)
-    if pgn==65276:
-        d['Fuel Level (%)']='N/A' if _is_na(b[1]) else round(b[1]*0.4,3)
-    if pgn==61443:
-        d['Engine Load (%)']='N/A' if _is_na(b[2]) else b[2]*1.0
-    return {'pgn':pgn,'sa':sa,'decoded':d}
+    pgn=(pdu_format<<8)|((arb>>8)&_PS_MASK[pdu_format])
+    dec=_PGN_DECODERS.get(pgn)
+    if dec is None:
+        return Decoded(pgn,sa,_NO_FIELDS)
+    # bytes.ljust is a no-op (same object) for full 8-byte frames; indexing
+    # bytes yields ints directly — no list() copy per frame.
+    return Decoded(pgn,sa,dec(fr.data.ljust(8,b"\x00")))
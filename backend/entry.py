@@ -7,7 +7,7 @@ from auto_setup import find_free_port
 from app import app  # your FastAPI instance
 
 def main():
-    port = find_free_port(8000, max_tries=10)
+    port = find_free_port(8000)
     url = f"http://127.0.0.1:{port}"
     print(f"[launch] Starting CAN Tool at {url}")
     try:
@@ -1,9 +1,33 @@
-from pydantic import BaseModel
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, Optional, List
+
+# extra='ignore' keeps pydantic-core's single-pass Rust parser on the fast
+# path instead of collecting unknown fields.
 class ConnectRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore')
     channel: str
     bitrate: Optional[int] = None
+
+class SendItem(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    id_hex: str
+    data_hex: str
+
 class SendRequest(BaseModel):
-    frames: List[Dict[str,str]]
+    model_config = ConfigDict(extra='ignore')
+    frames: List[SendItem]
+
 class LogStartRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore')
     format: str = 'csv'
+
+# Typed at the top level so pydantic-core parses the POST body in one pass;
+# the items stay free-form dicts because their shape belongs to the UI.
+class PresetsPayload(BaseModel):
+    model_config = ConfigDict(extra='allow')
+    presets: List[Dict[str, Any]] = []
+    frames: List[Dict[str, Any]] = []
+
+class GroupsPayload(BaseModel):
+    model_config = ConfigDict(extra='allow')
+    groups: List[Dict[str, Any]] = []
@@ -9,6 +9,8 @@ with open("presets.json","r") as f:
 
 bus = can.interface.Bus("vcan0", bustype="socketcan")
 
+# Sequential sends on purpose: python-can's cyclic tasks require all frames
+# in a task to share one arbitration ID, and the presets span several.
 for p in presets:
     arb = int(p["id_hex"], 16)
     data = bytes.fromhex(p["data_hex"])
@@ -17,4 +19,5 @@ for p in presets:
     bus.send(msg)
     time.sleep(0.05)
 
+bus.shutdown()
 print("Done")
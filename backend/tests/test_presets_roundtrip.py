@@ -0,0 +1,19 @@
+import app as app_module
+from fastapi.testclient import TestClient
+
+
+def test_frames_only_post_roundtrips(tmp_path, monkeypatch):
+    # A frames-only POST (the documented shape) must come back intact;
+    # persisting the default "presets": [] used to win on read-back.
+    monkeypatch.setattr(app_module, "PRESETS_PATH", tmp_path / "presets.json")
+    monkeypatch.setattr(app_module, "_presets_view", None)
+    app_module._json_cache.clear()
+
+    client = TestClient(app_module.app)
+    frames = [{"id_hex": "18FEE5FF", "data_hex": "A0860100FFFFFFFF", "name": "hours"}]
+    assert client.post("/api/presets", json={"frames": frames}).status_code == 200
+
+    body = client.get("/api/presets").json()
+    assert body["frames"] == frames
+    assert body["presets"] == [{"name": "hours", "id_hex": "18FEE5FF",
+                                "data_hex": "A0860100FFFFFFFF"}]
@@ -78,9 +78,12 @@ export default function App() {
     const ws = streamSocket()
     wsRef.current = ws
 
+    ws.binaryType = "arraybuffer"
     ws.onmessage = (ev) => {
       try {
-        const data = JSON.parse(ev.data)
+        // Backend sends orjson-encoded binary frames; older builds sent text.
+        const text = typeof ev.data === "string" ? ev.data : new TextDecoder().decode(ev.data)
+        const data = JSON.parse(text)
         if (data?.type === "frames" && Array.isArray(data.items)) {
           const items = data.items.map(normalizeFrame)
           setFrames((prev) => {